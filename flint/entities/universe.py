@@ -173,7 +173,7 @@ class Base(Entity):
 
     def news(self):
         """A list of all news items being shown on this base"""
-        return missions.get_news().get(self.nickname, [])
+        return missions.get_news().get(self.nickname, ())
 
 
     def owner(self) -> 'Faction':
@@ -247,7 +247,9 @@ class Faction(Entity):
     def ships(self) -> EntitySet[Ship]:
         """All ships this faction uses, as defined in faction_props.ini"""
         result = []
-        npc_ship = self.props().npc_ship if type(self.props().npc_ship) == list else [self.props().npc_ship]
+        npc_ship = self.props().npc_ship
+        if not isinstance(npc_ship, (list, tuple)):  # a single entry is folded to a bare string
+            npc_ship = (npc_ship,)
 
         for x in npc_ship:
             if routines.get_npcships()[x].ship():
@@ -21,6 +21,7 @@ from typing import Union, List, Dict, Any, Tuple
 from collections import defaultdict
 import concurrent.futures
 import itertools
+import mmap
 import warnings
 import string
 
@@ -66,13 +67,18 @@ def parse_file(path: str):
     of entry/value pairs."""
     if bini.is_bini(path):
         return bini.parse_file(path)
+    with open(path, 'rb') as f:
+        try:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                raw = mapped.read()  # memory-mapping lets the OS page the file in rather than buffering a copy
+        except ValueError:  # an empty file cannot be mapped
+            raw = b''
     try:
-        with open(path, encoding='windows-1252') as f:
-            contents = f.read().lower()  # files are case insensitive
-    except:
-        with open(path, encoding='utf-8') as f:
-            contents = f.read().lower()  # files are case insensitive       
-            
+        contents = raw.decode('windows-1252').lower()  # files are case insensitive
+    except UnicodeDecodeError:
+        contents = raw.decode('utf-8').lower()  # files are case insensitive
+
+
     contents.replace(DELIMITER_COMMENT + SECTION_NAME_START, '')  # delete commented section markers
     return list(map(parse_section, contents.split(SECTION_NAME_START)))
 
@@ -11,7 +11,6 @@ they lack associated string resource fields and/or nicknames.
 Instead they "belong to" a composite Entity, like a Base or Faction.
 """
 from typing import Tuple, List, Dict, Optional
-from collections import defaultdict
 
 from dataclassy import dataclass, Internal
 
@@ -23,7 +22,9 @@ from . import cached, paths
 def get_faction_props() -> Dict[str, 'FactionProps']:
     """Produce a dictionary of faction nicknames to their associated FactionProps object."""
     props = ini.sections(paths.construct_path('DATA/MISSIONS/faction_prop.ini'))
-    return {p['affiliation']: FactionProps(**p) for p in props['factionprops']}
+    return {p['affiliation']: FactionProps(**{key: tuple(value) if type(value) is list else value
+                                              for key, value in p.items()})
+            for p in props['factionprops']}
 
 
 @cached
@@ -33,50 +34,91 @@ def get_mbases() -> Dict[str, 'MBase']:
 
     Implementation note: because the ordering of these sections is guaranteed (breaking this rule will crash
     Freelancer), it is safe to assume that base is defined in subsequent code paths."""
-    sections = ini.group(paths.construct_path('DATA/MISSIONS/mbases.ini'), fold_sections=False)
+    return {base.nickname: base for base in _iter_mbases()}
 
-    bases = []
 
-    for name, contents in sections:
-        contents = list(filter(None, contents))
+def _iter_mbases():
+    """Fold the sections of mbases.ini into MBase objects, yielding each base as soon as its last section has been
+    consumed rather than materialising them all in an intermediate list."""
+    base = None
 
+    for name, contents in ini.group(paths.construct_path('DATA/MISSIONS/mbases.ini'), fold_sections=False):
         if name == 'mbase':
-            base = MBase(**contents[0])
-            bases.append(base)
-        elif name == 'mvendor':
-            # noinspection PyUnboundLocalVariable
-            base.vendors.append(MVendor(**contents[0]))
-        elif name == 'basefaction':
-            base.factions.extend(BaseFaction(**faction) for faction in contents if not "reputation" in faction.keys())
-        elif name == 'gf_npc':
-            base.npcs.extend(GF_NPC(**npc) for npc in contents if 'nickname' in npc)
-        elif name == 'mroom':
-            base.rooms.extend(MRoom(**room) for room in contents)
-
-    return {b.nickname: b for b in bases}
+            if base is not None:
+                yield _freeze_base(base)
+            base = MBase(**next(filter(None, contents)))
+        elif base is not None:
+            handler = _MBASE_SECTION_HANDLERS.get(name)
+            if handler:
+                handler(base, contents)
+
+    if base is not None:
+        yield _freeze_base(base)
+
+
+def _freeze_base(base: 'MBase') -> 'MBase':
+    """Freeze a completed MBase's collections into tuples. get_mbases' result is cached and shared between callers,
+    so nothing handed out should be mutable."""
+    base.vendors = tuple(base.vendors)
+    base.factions = tuple(base.factions)
+    base.npcs = tuple(base.npcs)
+    base.rooms = tuple(base.rooms)
+    return base
+
+
+def _add_vendor(base: 'MBase', contents):
+    base.vendors.append(MVendor(**next(filter(None, contents))))
+
+
+def _add_factions(base: 'MBase', contents):
+    base.factions.extend(BaseFaction(**faction) for faction in contents if faction and 'reputation' not in faction)
+
+
+def _add_npcs(base: 'MBase', contents):
+    base.npcs.extend(GF_NPC(**npc) for npc in contents if 'nickname' in npc)
+
+
+def _add_rooms(base: 'MBase', contents):
+    base.rooms.extend(MRoom(**room) for room in contents if room)
+
+
+# section name to a handler folding that section into the preceding MBase; dispatching through a dict replaces
+# an if/elif chain which compared every section name against each alternative in turn
+_MBASE_SECTION_HANDLERS = {'mvendor': _add_vendor, 'basefaction': _add_factions, 'gf_npc': _add_npcs,
+                           'mroom': _add_rooms}
+
+# entries which legitimately appear multiple times per news section; all other repeated entries are collapsed
+# to their last value, mirroring how Freelancer resolves the duplicates found in mods' news files
+_NEWS_MULTI_KEYS = frozenset({'base', 'rank'})
+
 
 @cached
-def get_news() -> Dict[str, List['NewsItem']]:
+def get_news() -> Dict[str, Tuple['NewsItem', ...]]:
     """Produce a dictionary of base nicknames to their news items."""
     news = ini.parse(paths.construct_path('DATA/MISSIONS/news.ini'))
 
-    result = defaultdict(list)
+    result: Dict[str, List['NewsItem']] = {}
 
     for _, contents in news:
         for key, value in contents.items():
-            if type(value) == list and key != "base" and key != "rank":
+            if type(value) is list and key not in _NEWS_MULTI_KEYS:
                 contents[key] = value[-1]
 
         bases = contents.get('base')
         if bases:
-            if type(bases) is not list:
-                bases = [bases]
+            bases = (bases,) if type(bases) is not list else tuple(bases)
+            contents['base'] = bases
+            item = NewsItem(**contents)  # one shared item; its contents are identical for every base listing it
+            # resolve the item's strings now, while this (cached) routine runs, rather than at render time
+            item.category_()
+            item.headline_()
+            item.text_()
             for base in bases:
-                result[base].append(NewsItem(**contents))
+                result.setdefault(base, []).append(item)
 
-    return dict(result)
+    return {base: tuple(items) for base, items in result.items()}
 
-@dataclass
+@dataclass(slots=True)
 class NewsItem:
     """A news item, found in news.ini."""
     category: int
@@ -86,21 +128,46 @@ class NewsItem:
     icon: str = ''
     logo: str = ''
     audio: bool = False
-    base: Internal[List[str]] = []
+    base: Internal[Tuple[str, ...]] = ()
+
+    # resolved strings, memoised because news feeds query the same items repeatedly
+    _category: Internal[Optional[str]] = None
+    _headline: Internal[Optional[str]] = None
+    _text: Internal[Optional[str]] = None
+
+    # handwritten for speed: one item is constructed per news section, and a plain __init__ sidesteps the
+    # default-copying machinery of the generated one
+    def __init__(self, category: int, headline: int, text: int, rank: Tuple[str, ...] = (), icon: str = '',
+                 logo: str = '', audio: bool = False, base: Tuple[str, ...] = ()):
+        self.category = category
+        self.headline = headline
+        self.text = text
+        self.rank = rank
+        self.icon = icon
+        self.logo = logo
+        self.audio = audio
+        self.base = base
+        self._category = self._headline = self._text = None
 
     def category_(self) -> str:
         """The category description of this news item."""
-        return dll.lookup(self.category)
+        if self._category is None:
+            self._category = dll.lookup(self.category)
+        return self._category
 
     def headline_(self) -> str:
         """The headline of this news item."""
-        return dll.lookup(self.headline)
+        if self._headline is None:
+            self._headline = dll.lookup(self.headline)
+        return self._headline
 
     def text_(self) -> str:
         """This news item's textual content."""
-        return dll.lookup(self.text)
+        if self._text is None:
+            self._text = dll.lookup(self.text)
+        return self._text
 
-@dataclass
+@dataclass(slots=True)
 class MBase:
     """A "mission base" section, found in mbases.ini. Provides additional attributes to the base that nickname refers
     to. The optional fields of this class, as with the following classes, are based on my observations of Discovery
@@ -110,19 +177,31 @@ class MBase:
     diff: int
     msg_id_prefix: Optional[str] = None
 
-    vendors: List['MVendor'] = []
-    factions: List['BaseFaction'] = []
-    npcs: List['GF_NPC'] = []
-    rooms: List['MRoom'] = []
-
-
-@dataclass
+    vendors: Tuple['MVendor', ...] = ()
+    factions: Tuple['BaseFaction', ...] = ()
+    npcs: Tuple['GF_NPC', ...] = ()
+    rooms: Tuple['MRoom', ...] = ()
+
+    # handwritten for speed (see NewsItem); the collections start as lists so get_mbases can fill them in, and are
+    # frozen into tuples once the base's sections have all been consumed
+    def __init__(self, nickname: str, local_faction: str, diff: int, msg_id_prefix: Optional[str] = None):
+        self.nickname = nickname
+        self.local_faction = local_faction
+        self.diff = diff
+        self.msg_id_prefix = msg_id_prefix
+        self.vendors = []
+        self.factions = []
+        self.npcs = []
+        self.rooms = []
+
+
+@dataclass(slots=True)
 class MVendor:
     """Found in mbases.ini, this section describes the preceding base's mission vendor, aka the "jobs board"."""
     num_offers: Tuple[int, int]
 
 
-@dataclass
+@dataclass(slots=True)
 class BaseFaction:
     """Found in mbases.ini, this section describes an individual NPC present on the preceding base."""
     faction: str
@@ -133,7 +212,7 @@ class BaseFaction:
 
 
 # noinspection PyPep8Naming
-@dataclass
+@dataclass(slots=True)
 class GF_NPC:
     """Found in mbases.ini, this section describes an individual NPC present on the preceding base."""
     nickname: str
@@ -148,6 +227,60 @@ class GF_NPC:
     room: Optional[str] = None
     bribe: List[Tuple[str, int, int]] = []
     rumor: List[Tuple[str, str, int, int]] = []
+
+    # the fields below are rare; they live in a GF_NPCExtras allocated only when one of them is set, so the
+    # thousands of NPCs which never define them don't carry a slot apiece. Properties keep the attribute API
+    _extras: Internal[Optional['GF_NPCExtras']] = None
+
+    # handwritten for speed (see NewsItem): this is by far the most-instantiated class in the file. The parameter
+    # order (required fields first) matches the signature dataclassy would generate
+    def __init__(self, nickname, individual_name, affiliation, voice, body=None, head=None, lefthand=None,
+                 righthand=None, misn=None, room=None, bribe=None, rumor=None, know=None, knowdb=None,
+                 rumorknowdb=None, accessory=None, base_appr=None, rumor_type2=None):
+        self.nickname = nickname
+        self.individual_name = individual_name
+        self.affiliation = affiliation
+        self.voice = voice
+        self.body = body
+        self.head = head
+        self.lefthand = lefthand
+        self.righthand = righthand
+        self.misn = misn if misn is not None else []
+        self.room = room
+        self.bribe = bribe if bribe is not None else []
+        self.rumor = rumor if rumor is not None else []
+        extras = (know, knowdb, rumorknowdb, accessory, base_appr, rumor_type2)
+        self._extras = GF_NPCExtras(*extras) if any(e is not None for e in extras) else None
+
+    @property
+    def know(self) -> Optional[Tuple[int, int, int, int]]:
+        return self._extras.know if self._extras is not None else None
+
+    @property
+    def knowdb(self) -> Optional[str]:
+        return self._extras.knowdb if self._extras is not None else None
+
+    @property
+    def rumorknowdb(self) -> Optional[str]:
+        return self._extras.rumorknowdb if self._extras is not None else None
+
+    @property
+    def accessory(self) -> Optional[str]:
+        return self._extras.accessory if self._extras is not None else None
+
+    @property
+    def base_appr(self) -> Optional[str]:
+        return self._extras.base_appr if self._extras is not None else None
+
+    @property
+    def rumor_type2(self) -> Optional[Tuple[str, str, int, int]]:
+        return self._extras.rumor_type2 if self._extras is not None else None
+
+
+# noinspection PyPep8Naming
+@dataclass(slots=True)
+class GF_NPCExtras:
+    """The rarely-populated trailing fields of a GF_NPC section, split out of GF_NPC itself (see above)."""
     know: Optional[Tuple[int, int, int, int]] = None
     knowdb: Optional[str] = None
     rumorknowdb: Optional[str] = None
@@ -156,7 +289,7 @@ class GF_NPC:
     rumor_type2: Optional[Tuple[str, str, int, int]] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class MRoom:
     """Found in mbases.ini, this section describes a particular room in the preceding base."""
     nickname: str
@@ -164,7 +297,7 @@ class MRoom:
     fixture: List[Tuple[str, str, str, str]] = []
 
 
-@dataclass
+@dataclass(slots=True)
 class FactionProps:
     """The FactionProps section, found in faction_prop.ini, defines much of the behaviour of a faction's NPCs in
     space."""
@@ -173,10 +306,10 @@ class FactionProps:
     nickname_plurality: str
     msg_id_prefix: str
     jump_preference: str
-    npc_ship: List[str] = []
-    voice: List[str] = []
+    npc_ship: Tuple[str, ...] = ()
+    voice: Tuple[str, ...] = ()
     mc_costume: Optional[str] = None
-    space_costume: List[Tuple[str, str, str]] = []
+    space_costume: Tuple[Tuple[str, str, str], ...] = ()
     firstname_male: Optional[Tuple[int, int]] = None
     firstname_female: Optional[Tuple[int, int]] = None
     lastname: Optional[Tuple[int, int]] = None
@@ -184,7 +317,7 @@ class FactionProps:
     formation_desig: Optional[Tuple[int, int]] = None
     large_ship_desig: Optional[int] = None
     large_ship_names: Tuple[int, int] = None
-    scan_for_cargo: List[Tuple[str, int]] = []
+    scan_for_cargo: Tuple[Tuple[str, int], ...] = ()
     scan_announce: bool = False
     scan_chance: float = 0.0
-    formation: Optional[List[Tuple[str, str]]] = None
+    formation: Optional[Tuple[Tuple[str, str], ...]] = None
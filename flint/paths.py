@@ -17,6 +17,9 @@ install: Optional[str] = None
 inis: Dict[str, Tuple[str]] = {}  # ini category (defined in freelancer.ini) to a list of paths
 dlls: Dict[int, str] = {}  # dll number to path
 
+_case_cache: Dict[str, str] = {}  # casefolded absolute path to its real casing on the filesystem
+_dir_index: Dict[str, Dict[str, str]] = {}  # resolved directory path to a casefolded-name to real-name index
+
 
 def set_install_path(new_path, discovery=False, skipFLCheck = False):
     """Set the path to the installation"""
@@ -29,6 +32,8 @@ def set_install_path(new_path, discovery=False, skipFLCheck = False):
     if install != new_path:
         install = new_path
         invalidate_cache()
+        _case_cache.clear()
+        _dir_index.clear()
         generate_index()
 
 
@@ -37,49 +42,75 @@ def install_path_set() -> bool:
     return install is not None
 
 
-@cached
 def fix_path_case(path: str) -> str:
     """Thanks to the nature of Windows' file systems, Freelancer frequently uses apparently arbitrary casing for many
     paths. This function takes an absolute path and returns it with the casing as it really is on the filesystem.
 
-    This function mixes iteration/recursion to make the use of dynamic programming more effective. If one recursive
-    function with an additional tail accumulator was used, it would prevent the cache from being effective at storing
-    precomputed known-correct paths."""
-
-    @cached
-    def correct_subpath(path_: str) -> str:
-        """Recursively reduce a path from its end until it diverges from the filesystem's structure. Then, find the
-        correct case for that divergent level and return the subpath."""
-        head, tail = os.path.split(path_)
-        if os.path.exists(head):  # go back till divergence
-            #  tail is now divergent level; find its correct case (taking the first match)
-            correct_case = next(filter(lambda s: s.casefold() == tail.casefold(), os.listdir(head)), None)
-            if correct_case is None:  # if no match possible
-                raise FileNotFoundError
-            return os.path.join(head, correct_case)
-        return correct_subpath(head)
-
+    The path is walked top-down, one component per level, with `os.scandir` used to find the component's real casing.
+    Every corrected prefix is stored in `_case_cache`, so resolving a path implicitly resolves (and caches) all its
+    ancestors, and subsequent calls for paths under the same directories are answered without touching the
+    filesystem."""
     path = path.rstrip(r'\/')  # remove trailing slashes which mess up path.split
     if os.name == 'nt':
         return path  # on Windows path.exists ignores case, so no point in continuing
 
-    result = correct_subpath(path)
-    while len(result) != len(path):
-        result = correct_subpath(result + path[len(result):])
-    return result
+    # collapse . and .. components (e.g. from freelancer.ini's 'data path') - they are not real directory
+    # entries, so the walk below could never match them against a scandir listing
+    path = os.path.normpath(path)
+
+    folded = path.casefold()
+    result = _case_cache.get(folded)
+    if result is not None:
+        return result
+
+    components = folded.split(os.sep)  # leading os.sep produces an initial empty component
+    prefix, corrected = components[0], components[0] or os.sep
+    resolving = False  # prefixes are cached contiguously from the root, so after one miss no deeper hit is possible
+    for component in components[1:]:
+        prefix += os.sep + component
+        if not resolving:
+            cached_prefix = _case_cache.get(prefix)
+            if cached_prefix is not None:  # reuse an already-resolved ancestor
+                corrected = cached_prefix
+                continue
+            resolving = True
+        index = _dir_index.get(corrected)
+        if index is None:  # scan each directory once and index its entries by casefolded name
+            index = {}
+            with os.scandir(corrected) as entries:
+                for entry in entries:
+                    index.setdefault(entry.name.casefold(), entry.name)  # keep the first match
+            _dir_index[corrected] = index
+        real_name = index.get(component)
+        if real_name is None:  # if no match possible
+            raise FileNotFoundError
+        corrected = os.path.join(corrected, real_name)
+        _case_cache[prefix] = corrected
+    return corrected
 
 
 def is_probably_freelancer(path, discovery=False):
     """Verifies that the given directory is (probably) an actual Freelancer installation, by checking that identifying
     files and directories are present."""
-    identifiers = {'DATA', 'DLLS', 'EXE'}
+    identifiers = {'data', 'dlls', 'exe'}
     if discovery:
-        identifiers |= {'DSLauncher.exe'}
-    return os.path.isdir(path) and identifiers.issubset(os.listdir(path))
+        identifiers |= {'dslauncher.exe'}
+    if not os.path.isdir(path):
+        return False
+    with os.scandir(path) as entries:
+        for entry in entries:
+            identifiers.discard(entry.name.lower())
+            if not identifiers:  # stop as soon as everything has been found
+                return True
+    return False
 
 
+@cached
 def construct_path(*subpath):
-    """Form an absolute path to a file in the install directory based on a subpath relative to its root."""
+    """Form an absolute path to a file in the install directory based on a subpath relative to its root.
+
+    Results are cached: most paths share a handful of directory prefixes (`DATA/MISSIONS/...`, `EXE/...`), and
+    `fix_path_case` caches each resolved prefix, so even a cache miss here only has to scan for the leaf component."""
     candidate = os.path.join(install, *subpath).replace('\\', '/')
     try:
         return fix_path_case(candidate)
@@ -90,13 +121,24 @@ def construct_path(*subpath):
 def generate_index():
     """Use freelancer.ini to build an index of inis and dlls."""
     freelancer_ini = os.path.join(install, 'EXE/freelancer.ini')
-    parsed = ini.sections(freelancer_ini, fold_values=False)
-
-    resources = ['resources.dll', *parsed['resources'][0]['dll']]  # resources.dll is hardcoded as DLL 0
 
-    data = parsed['data'][0]
-    root = parsed['freelancer'][0]  # todo: also look at 'data path'
+    # bucket the sections of interest in a single pass, taking the first instance of each
+    root = resource_section = data = None
+    for name, contents in ini.parse(freelancer_ini, fold_values=False):
+        if name == 'freelancer' and root is None:
+            root = contents  # todo: also look at 'data path'
+        elif name == 'resources' and resource_section is None:
+            resource_section = contents
+        elif name == 'data' and data is None:
+            data = contents
+
+    resources = ['resources.dll', *resource_section['dll']]  # resources.dll is hardcoded as DLL 0
     data.update(root)
 
+    # every indexed path lives under one of two roots; resolving them up front means each of the construct_path
+    # calls below finds its directory prefix already cached and only has to case-fix the file's own components
+    construct_path('EXE')
+    construct_path('DATA')
+
     dlls.update({i: construct_path('EXE', f) for i, f in enumerate(resources)})
     inis.update({category: tuple(construct_path('DATA', f) for f in files) for category, files in data.items()})